@@ -17,7 +17,8 @@ with open(os.path.join(here, 'requirements.txt'), encoding='utf-8') as requireme
 with open(os.path.join(here, 'requirements_dev.txt'), encoding='utf-8') as requirements_dev_file:
     requirements_dev = requirements_dev_file.read().splitlines()
 
-extras_require = {'ipyopt': ['ipyopt']}
+extras_require = {'ipyopt': ['ipyopt'],
+                  'numba': ['numba']}
 
 allreq = sum(extras_require.values(), [])
 
@@ -33,7 +34,7 @@ tests_require = [
     'matplotlib'  # for plots in examples
 ]
 extras_require['all'] = allreq
-extras_require['tests'] = tests_require + extras_require['ipyopt']
+extras_require['tests'] = tests_require + extras_require['ipyopt'] + extras_require['numba']
 extras_require['dev'] = requirements_dev + extras_require['tests']
 extras_require['alldev'] = list(set(extras_require['all'] + extras_require['dev']))
 
@@ -2,6 +2,7 @@
 import numpy as np
 import pytest
 import scipy.stats
+import tensorflow as tf
 
 import zfit
 from zfit import z
@@ -56,6 +57,20 @@ def test_gaussian_constraint_shape_errors():
         GaussianConstraint(params=param1, observation=[obs1, obs3], uncertainty=[2, 3]).value()
 
 
+def test_gaussian_constraint_invalid_uncertainty():
+    param1 = zfit.Parameter("Param1", 5)
+    param2 = zfit.Parameter("Param2", 6)
+
+    constr = GaussianConstraint(params=[param1, param2], observation=[4, 5], uncertainty=[1, 2])
+    assert not constr.distribution.validate_args  # no assertions on every evaluation
+    param3 = zfit.Parameter("Param3", 5)  # new parameters, the observations are named after them
+    param4 = zfit.Parameter("Param4", 6)
+    constr_invalid = GaussianConstraint(params=[param3, param4], observation=[4, 5],
+                                        uncertainty=np.array([[1., 0.], [0., -1.]]))
+    with pytest.raises(tf.errors.InvalidArgumentError):  # caught by the cholesky decomposition
+        constr_invalid.value()
+
+
 def test_gaussian_constraint_matrix():
     param1 = zfit.Parameter("Param1", 5)
     param2 = zfit.Parameter("Param2", 6)
@@ -212,6 +212,57 @@ def test_data_range(weights_factory):
     np.testing.assert_equal(data1, dataset.value().numpy())
 
 
+def test_data_range_cut_cached():
+    data1 = np.array([[1., 2],
+                      [0, 1],
+                      [-2, 1]])
+    obs = ['obs1', 'obs2']
+    data_range = zfit.Space(obs, limits=((0.5, 1), (1.5, 2.5)))
+    weights = np.array([1., 2., 3.])
+
+    dataset = zfit.Data.from_tensor(obs=obs, tensor=data1, weights=weights)
+    with dataset.set_data_range(data_range):
+        value_cut = dataset.value()
+        weights_cut = dataset.weights
+        assert dataset.value() is value_cut
+        assert dataset.weights is weights_cut
+    np.testing.assert_equal(data1, dataset.value().numpy())
+    with dataset.set_data_range(data_range):
+        assert dataset.value() is value_cut
+        np.testing.assert_equal(data1[:1], dataset.value().numpy())
+
+        dataset.set_weights(weights * 2)
+        np.testing.assert_equal(weights[:1] * 2, dataset.weights.numpy())
+
+    for i in range(dataset._constant_cut_cache_size + 1):
+        with dataset.set_data_range(zfit.Space(obs, limits=((0.5 - i, 1), (1.5, 2.5)))):
+            dataset.value()
+    assert len(dataset._constant_cut_cache) == dataset._constant_cut_cache_size
+
+    from zfit.util.cache import clear_graph_cache
+    clear_graph_cache()
+    assert not dataset._constant_cut_cache
+
+
+def test_data_range_variable_limits():
+    data1 = np.array([[1.], [0.], [-2.]])
+    obs = 'obs1'
+    upper = tf.Variable(1.5, dtype=tf.float64)
+    dataset = zfit.Data.from_tensor(obs=obs, tensor=data1)
+
+    @tf.function(autograph=False)
+    def nevents_inside():
+        data_range = zfit.Space(obs, limits=(-1., upper))
+        assert data_range.rect_limits_are_tensors
+        with dataset.set_data_range(data_range):
+            return tf.shape(dataset.value())[0]
+
+    assert nevents_inside().numpy() == 2
+    upper.assign(0.5)
+    assert nevents_inside().numpy() == 1
+    assert not dataset._constant_cut_cache
+
+
 def test_multidim_data_range():
     data1 = np.linspace((0, 5), (10, 15), num=11)
     data_true = np.linspace(10, 15, num=6)
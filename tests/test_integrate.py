@@ -4,6 +4,7 @@ from contextlib import suppress
 import numpy as np
 import pytest
 import tensorflow as tf
+import tensorflow_probability as tfp
 
 import zfit
 import zfit.core.integration as zintegrate
@@ -223,6 +224,14 @@ def test_mc_integration(chunksize, limits):
         Space(limits=limits3, axes=(0, 1))).numpy() == pytest.approx(integral3, rel=0.03)
 
 
+def test_sample_halton_sequence_cached():
+    sample = zintegrate.sample_halton_sequence_cached(dim=2, num_results=1000.)
+    assert zintegrate.sample_halton_sequence_cached(dim=2, num_results=1000) is sample
+    sample_true = tfp.mcmc.sample_halton_sequence(dim=2, num_results=1000, dtype=tf.float64, randomized=False)
+    np.testing.assert_allclose(sample.numpy(), sample_true.numpy())
+    assert zintegrate.sample_halton_sequence_cached(dim=3, num_results=1000).shape == (1000, 3)
+
+
 @pytest.mark.flaky(2)
 def test_mc_partial_integration():
     values = z.convert_to_tensor(func4_values)
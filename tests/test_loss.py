@@ -11,7 +11,8 @@ from zfit.core.loss import UnbinnedNLL
 from zfit.core.space import Space
 from zfit.minimize import Minuit
 from zfit.pdf import Gauss
-from zfit.util.exception import IntentionAmbiguousError
+from zfit.util.exception import (IntentionAmbiguousError,
+                                 SpecificFunctionNotImplemented)
 
 mu_true = 1.2
 sigma_true = 4.1
@@ -55,10 +56,20 @@ obs1 = zfit.Space('obs1', (np.min([test_values_np[:, 0], test_values_np2]) - 1.4
 
 mu_constr = [1.6, 0.02]  # mu, sigma
 sigma_constr = [3.5, 0.01]
-constr = lambda: [mu_constr[1], sigma_constr[1]]
-constr_tf = lambda: z.convert_to_tensor(constr())
-covariance = lambda: np.array([[mu_constr[1] ** 2, 0], [0, sigma_constr[1] ** 2]])
-covariance_tf = lambda: z.convert_to_tensor(covariance())
+constr = [mu_constr[1], sigma_constr[1]]
+constr_tf = z.convert_to_tensor(constr)
+covariance = np.array([[mu_constr[1] ** 2, 0], [0, sigma_constr[1] ** 2]])
+covariance_tf = z.convert_to_tensor(covariance)
+
+
+@pytest.fixture(scope='module')
+def gauss_data():
+    return zfit.Data.from_tensor(obs=obs1, tensor=tf.constant(test_values_np))
+
+
+@pytest.fixture(scope='module')
+def gauss_data2():
+    return zfit.Data.from_tensor(obs=obs1, tensor=tf.constant(test_values_np2))
 
 
 def create_gauss1():
@@ -100,16 +111,12 @@ def test_extended_unbinned_nll(size):
     assert params[yield3]['value'] == pytest.approx(size, rel=0.005)
 
 
-def test_unbinned_simultaneous_nll():
-    test_values = tf.constant(test_values_np)
-    test_values = zfit.Data.from_tensor(obs=obs1, tensor=test_values)
-    test_values2 = tf.constant(test_values_np2)
-    test_values2 = zfit.Data.from_tensor(obs=obs1, tensor=test_values2)
+def test_unbinned_simultaneous_nll(gauss_data, gauss_data2):
     gaussian1, mu1, sigma1 = create_gauss1()
     gaussian2, mu2, sigma2 = create_gauss2()
     gaussian2 = gaussian2.create_extended(zfit.Parameter('yield_gauss2', 5))
     nll = zfit.loss.UnbinnedNLL(model=[gaussian1, gaussian2],
-                                data=[test_values, test_values2],
+                                data=[gauss_data, gauss_data2],
                                 )
     minimizer = Minuit(tol=1e-5)
     status = minimizer.minimize(loss=nll, params=[mu1, sigma1, mu2, sigma2])
@@ -122,16 +129,52 @@ def test_unbinned_simultaneous_nll():
     assert params[sigma2]['value'] == pytest.approx(np.std(test_values_np2), rel=0.007)
 
 
+def test_unbinned_simultaneous_nll_weighted(gauss_data):
+    weights = np.random.uniform(0.5, 1.5, size=1000)
+    test_values2 = zfit.Data.from_tensor(obs=obs1, tensor=tf.constant(test_values_np2[:1000]),
+                                         weights=weights)
+    gaussian1, mu1, sigma1 = create_gauss1()
+    gaussian2, mu2, sigma2 = create_gauss2()
+    options = {'subtr_const': False}
+    nll = zfit.loss.UnbinnedNLL(model=[gaussian1, gaussian2], data=[gauss_data, test_values2],
+                                options=options)
+    nll1 = zfit.loss.UnbinnedNLL(model=gaussian1, data=gauss_data, options=options)
+    nll2 = zfit.loss.UnbinnedNLL(model=gaussian2, data=test_values2, options=options)
+
+    assert nll.value().numpy() == pytest.approx(nll1.value().numpy() + nll2.value().numpy(), rel=1e-8)
+
+
+def test_unbinned_nll_weighted_fit_range():
+    weights = np.random.uniform(0.5, 1.5, size=yield_true)
+    data = zfit.Data.from_tensor(obs=obs1, tensor=tf.constant(test_values_np), weights=weights)
+    gaussian1, mu1, sigma1 = create_gauss1()
+    fit_range = zfit.Space('obs1', (-2., 5.))
+    nll = zfit.loss.UnbinnedNLL(model=gaussian1, data=data, fit_range=fit_range,
+                                options={'subtr_const': False})
+
+    # the weights are cut to the fit range as the data
+    inside = (test_values_np[:, 0] > -2.) & (test_values_np[:, 0] < 5.)
+    log_probs = gaussian1.log_pdf(test_values_np[inside], norm_range=fit_range)
+    nll_true = -np.sum(weights[inside] * log_probs.numpy())
+    assert nll.value().numpy() == pytest.approx(nll_true, rel=1e-8)
+
+    zfit.run.chunking.active = True
+    zfit.run.chunking.max_n_points = 700
+    assert nll.value().numpy() == pytest.approx(nll_true, rel=1e-8)
+
+
 @pytest.mark.flaky(3)
 @pytest.mark.parametrize('weights', (None, np.random.normal(loc=1., scale=0.2, size=test_values_np.shape[0])))
 @pytest.mark.parametrize('sigma', (constr, constr_tf, covariance, covariance_tf))
 @pytest.mark.parametrize('options', ({'subtr_const': False}, {'subtr_const': True}))
-def test_unbinned_nll(weights, sigma, options):
+def test_unbinned_nll(weights, sigma, options, gauss_data):
     gaussian1, mu1, sigma1 = create_gauss1()
     gaussian2, mu2, sigma2 = create_gauss2()
 
-    test_values = tf.constant(test_values_np)
-    test_values = zfit.Data.from_tensor(obs=obs1, tensor=test_values, weights=weights)
+    if weights is None:
+        test_values = gauss_data
+    else:
+        test_values = zfit.Data.from_tensor(obs=obs1, tensor=tf.constant(test_values_np), weights=weights)
     nll_object = zfit.loss.UnbinnedNLL(model=gaussian1, data=test_values, options=options)
     minimizer = Minuit(tol=1e-5)
     status = minimizer.minimize(loss=nll_object, params=[mu1, sigma1])
@@ -143,7 +186,7 @@ def test_unbinned_nll(weights, sigma, options):
 
     constraints = zfit.constraint.nll_gaussian(params=[mu2, sigma2],
                                                observation=[mu_constr[0], sigma_constr[0]],
-                                               uncertainty=sigma())
+                                               uncertainty=sigma)
     nll_object = UnbinnedNLL(model=gaussian2, data=test_values,
                              constraints=constraints, options=options)
 
@@ -199,16 +242,14 @@ def test_add():
     assert simult_nll.fit_range == ranges
 
     def eval_constraint(constraints):
-        return z.reduce_sum([c.value() for c in constraints]).numpy()
+        return tf.add_n([c.value() for c in constraints]).numpy()
 
     assert eval_constraint(simult_nll.constraints) == eval_constraint(merged_contraints)
     assert set(simult_nll.get_params()) == {param1, param2, param3}
 
 
-# @pytest.mark.xfail  # TODO(TF2): grads not supported, use numerical ones? Or calculate on the fly?
 @pytest.mark.parametrize("chunksize", [10000000, 1000])
 def test_gradients(chunksize):
-    from numdifftools import Gradient
     zfit.run.chunking.active = True
     zfit.run.chunking.max_n_points = chunksize
 
@@ -229,27 +270,57 @@ def test_gradients(chunksize):
 
     nll = UnbinnedNLL(model=[gauss1, gauss2], data=[data1, data2])
 
-    def loss_func(values):
-        for val, param in zip(values, nll.get_cache_deps(only_floating=True)):
-            param.set_value(val)
-        return nll.value().numpy()
+    def loss_func(*values):
+        zfit.param.assign_values([param1, param2], values)
+        return nll.value()
+
+    def numerical_gradient(values):
+        # only the numerical jacobian is meaningful, the loss depends on the parameters, not on the values
+        _, numerical = tf.test.compute_gradient(loss_func, [z.constant(val) for val in values])
+        param1.set_value(initial1)
+        param2.set_value(initial2)
+        return [jacobian[0, 0] for jacobian in numerical]  # the loss is a scalar
+
+    both_gradients_true = numerical_gradient([initial1, initial2])
 
-    # theoretical, numerical = tf.test.compute_gradient(loss_func, list(params))
     gradient1 = nll.gradient(params=param1)
-    gradient_func = Gradient(loss_func)
-    # gradient_func = lambda *args, **kwargs: list(gradient_func_numpy(*args, **kwargs))
-    assert gradient1[0].numpy() == pytest.approx(gradient_func([param1.numpy()]))
-    param1.set_value(initial1)
-    param2.set_value(initial2)
+    np.testing.assert_allclose(gradient1[0].numpy(), both_gradients_true[0], rtol=1e-4)
     params = [param2, param1]
     gradient2 = nll.gradient(params=params)
-    both_gradients_true = list(reversed(list(gradient_func([initial1, initial2]))))  # because param2, then param1
-    assert [g.numpy() for g in gradient2] == pytest.approx(both_gradients_true)
+    np.testing.assert_allclose([g.numpy() for g in gradient2], list(reversed(both_gradients_true)),
+                               rtol=1e-4)  # because param2, then param1
 
-    param1.set_value(initial1)
-    param2.set_value(initial2)
     gradient3 = nll.gradient()
-    assert frozenset([g.numpy() for g in gradient3]) == pytest.approx(frozenset(both_gradients_true))
+    assert frozenset([g.numpy() for g in gradient3]) == pytest.approx(frozenset(both_gradients_true),
+                                                                      rel=1e-4)
+
+
+def test_chunked_nll(gauss_data):
+    test_values = gauss_data
+    weights = np.random.uniform(0.5, 1.5, size=yield_true)
+    test_values_weighted = zfit.Data.from_tensor(obs=obs1, tensor=tf.constant(test_values_np),
+                                                 weights=weights)
+    gaussian1, mu1, sigma1 = create_gauss1()
+
+    nll = zfit.loss.UnbinnedNLL(model=[gaussian1, gaussian1], data=[test_values, test_values_weighted],
+                                options={'subtr_const': False})
+    value_unchunked = nll.value().numpy()
+
+    zfit.run.chunking.active = True
+    zfit.run.chunking.max_n_points = 700  # not a divisor of the number of events
+    assert nll.value().numpy() == pytest.approx(value_unchunked, rel=1e-10)
+    assert nll._chunking_settings == (True, 700)  # the same loss picked up the new settings and was retraced
+    nll_chunked = nll.create_new()
+    assert nll_chunked.value().numpy() == pytest.approx(value_unchunked, rel=1e-10)
+
+    gaussian1._log_pdf_normalized_once(norm_range=None)  # normalized once, not per chunk
+    sum_pdf = zfit.pdf.SumPDF([gaussian1, zfit.pdf.Gauss(mu=1., sigma=4., obs=obs1)], fracs=0.3)
+    with pytest.raises(SpecificFunctionNotImplemented):  # evaluates its full log pdf per chunk
+        sum_pdf._log_pdf_normalized_once(norm_range=None)
+    nll_sum = zfit.loss.UnbinnedNLL(model=sum_pdf, data=test_values_weighted, options={'subtr_const': False})
+    value_sum_chunked = nll_sum.value().numpy()
+    zfit.run.chunking.active = False
+    assert nll_sum.value().numpy() == pytest.approx(value_sum_chunked, rel=1e-10)
 
 
 def test_simple_loss():
@@ -307,13 +378,41 @@ def test_simple_loss():
     assert true_c == pytest.approx(result2.params[params[2]]['value'], rel=0.5)
 
 
-def test_create_new_nll():
+def test_simple_loss_numba():
+    pytest.importorskip('numba')
+    true_a = 1.
+    true_b = 4.
+    true_c = -0.3
+    a_param = zfit.Parameter("variable_a15151loss", 1.5, -1., 20.)
+    b_param = zfit.Parameter("variable_b15151loss", 3.5)
+    c_param = zfit.Parameter("variable_c15151loss", -0.23)
+    param_list = [a_param, b_param, c_param]
+
+    def loss_func(values):
+        return np.log((values[0] - true_a) ** 2
+                      + (values[1] - true_b) ** 2
+                      + (values[2] - true_c) ** 4 + 0.42)
+
+    loss = zfit.loss.SimpleLoss(func=loss_func, params=param_list, errordef=1, backend='numba')
+    assert loss.value().numpy() == pytest.approx(loss_func(np.array([1.5, 3.5, -0.23])))
+    assert loss.create_new().value().numpy() == pytest.approx(loss.value().numpy())
+
+    minimizer = zfit.minimize.Minuit()
+    result = minimizer.minimize(loss=loss)
+    assert result.valid
+    assert true_a == pytest.approx(result.params[a_param]['value'], rel=0.03)
+    assert true_b == pytest.approx(result.params[b_param]['value'], rel=0.06)
+    assert true_c == pytest.approx(result.params[c_param]['value'], rel=0.5)
+
+    with pytest.raises(ValueError):
+        zfit.loss.SimpleLoss(func=loss_func, params=param_list, errordef=1, backend='nonexisting')
+
+
+def test_create_new_nll(gauss_data):
     gaussian1, mu1, sigma1 = create_gauss1()
     gaussian2, mu2, sigma2 = create_gauss2()
 
-    test_values = tf.constant(test_values_np)
-    test_values = zfit.Data.from_tensor(obs=obs1, tensor=test_values)
-    nll = zfit.loss.UnbinnedNLL(model=gaussian1, data=test_values)
+    nll = zfit.loss.UnbinnedNLL(model=gaussian1, data=gauss_data)
 
     nll2 = nll.create_new(model=gaussian2)
     assert nll2.data[0] is nll.data[0]
@@ -331,12 +430,10 @@ def test_create_new_nll():
     assert nll4._options != nll._constraints
 
 
-def test_create_new_extnll():
+def test_create_new_extnll(gauss_data):
     gaussian1, mu1, sigma1, yield1 = create_gauss3ext()
 
-    test_values = tf.constant(test_values_np)
-    test_values = zfit.Data.from_tensor(obs=obs1, tensor=test_values)
-    nll = zfit.loss.ExtendedUnbinnedNLL(model=gaussian1, data=test_values,
+    nll = zfit.loss.ExtendedUnbinnedNLL(model=gaussian1, data=gauss_data,
                                         constraints=zfit.constraint.GaussianConstraint(mu1, 1., 0.1))
 
     nll2 = nll.create_new(model=gaussian1)
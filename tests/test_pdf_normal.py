@@ -1,6 +1,8 @@
 #  Copyright (c) 2021 zfit
 import numpy as np
 import pytest
+import scipy.stats
+import tensorflow as tf
 
 import zfit
 from zfit import Parameter
@@ -36,6 +38,15 @@ def create_gauss():
     return gauss1, gauss2, gauss3, normal1, normal2, normal3
 
 
+def stored_mu_sigma(gauss):
+    """Return the values of mu and sigma of `gauss` as stored to compare with a reference.
+
+    The parameters store their initial values rounded to float32, which differs from the Python floats
+    by more than the tolerance of the comparisons.
+    """
+    return gauss.params['mu'].numpy(), gauss.params['sigma'].numpy()
+
+
 # gauss1, gauss2, gauss3, normal1, normal2, normal3 = create_gauss()
 
 
@@ -75,3 +86,63 @@ def test_truncated_gauss():
 
     assert inside_probs_gauss == pytest.approx(inside_probs_truncated, rel=1e-3)
     assert all(outside_probs_truncated == 0)
+
+
+def test_gauss_unnormalized_pdf():
+    gauss1, *_ = create_gauss()
+    mu, sigma = stored_mu_sigma(gauss1)
+    probs = gauss1.pdf(x=test_values, norm_range=False)
+    probs_true = scipy.stats.norm.pdf(test_values, loc=mu, scale=sigma)
+    np.testing.assert_allclose(probs.numpy(), probs_true, rtol=1e-7)
+
+
+def test_gauss_log_pdf():
+    gauss1, *_ = create_gauss()
+    mu, sigma = stored_mu_sigma(gauss1)
+    log_probs = gauss1.log_pdf(x=test_values, norm_range=False)
+    log_probs_true = scipy.stats.norm.logpdf(test_values, loc=mu, scale=sigma)
+    np.testing.assert_allclose(log_probs.numpy(), log_probs_true, rtol=1e-7)
+
+    far_values = np.array([mu1_true + 60 * sigma1_true])  # pdf underflows to 0, the log_pdf does not
+    log_probs_far = gauss1.log_pdf(x=far_values, norm_range=False)
+    assert np.all(np.isfinite(log_probs_far.numpy()))
+    np.testing.assert_allclose(log_probs_far.numpy(),
+                               scipy.stats.norm.logpdf(far_values, loc=mu, scale=sigma), rtol=1e-7)
+
+
+def test_gauss_log_pdf_numeric_checks():
+    gauss = Gauss(mu=mu1_true, sigma=-sigma1_true, obs=obs1)  # invalid sigma, log pdf is NaN
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        gauss.log_pdf(x=test_values, norm_range=False)
+
+
+def test_gauss_pdf_numeric_checks():
+    gauss = Gauss(mu=mu1_true, sigma=-sigma1_true, obs=obs1)  # invalid sigma, pdf is NaN as the log pdf
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        gauss.pdf(x=test_values, norm_range=False)
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        gauss.pdf(x=test_values, norm_range=norm_range1)
+
+
+def test_gauss_analytic_integral():
+    gauss1, *_ = create_gauss()
+    mu, sigma = stored_mu_sigma(gauss1)
+    lower, upper = limits1.rect_limits_np
+    integral = gauss1.integrate(limits=limits1, norm_range=False)
+    integral_true = (scipy.stats.norm.cdf(upper, loc=mu, scale=sigma)
+                     - scipy.stats.norm.cdf(lower, loc=mu, scale=sigma))
+    np.testing.assert_allclose(integral.numpy(), np.ravel(integral_true), rtol=1e-7)
+
+    # far in the tails, a difference of erf loses all precision
+    for n_sigma_lower, n_sigma_upper in ((-10, -8), (-30, -28), (8, 10)):
+        tail_limits = zfit.Space(obs=obs1, limits=(mu + n_sigma_lower * sigma, mu + n_sigma_upper * sigma))
+        integral_tail = gauss1.integrate(limits=tail_limits, norm_range=False)
+        if n_sigma_upper <= 0:
+            integral_tail_true = scipy.stats.norm.cdf(n_sigma_upper) - scipy.stats.norm.cdf(n_sigma_lower)
+        else:
+            integral_tail_true = scipy.stats.norm.sf(n_sigma_lower) - scipy.stats.norm.sf(n_sigma_upper)
+        assert integral_tail_true > 0
+        np.testing.assert_allclose(integral_tail.numpy(), integral_tail_true, rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        gauss1.analytic_integrate(limits=zfit.Space(obs=obs1, limits=(-np.inf, 1.5)), norm_range=False)
@@ -16,7 +16,6 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import tensorflow as tf
 from dotmap import DotMap
-from tensorflow_probability.python import mcmc as mc
 
 import zfit.z.numpy as znp
 
@@ -24,7 +23,7 @@ from .. import z
 from ..core.integration import Integration
 from ..settings import ztypes
 from ..util import ztyping
-from ..util.cache import GraphCachable
+from ..util.cache import GraphCachable, invalidate_graph
 from ..util.exception import (AnalyticIntegralNotImplemented,
                               AnalyticSamplingNotImplemented,
                               BasePDFSubclassingError,
@@ -81,8 +80,7 @@ class BaseModel(BaseNumeric, GraphCachable, BaseDimensional, ZfitModel):
     # TODO instructions on how to use
     """
     _DEFAULTS_integration = DotMap()
-    _DEFAULTS_integration.mc_sampler = lambda *args, **kwargs: mc.sample_halton_sequence(*args, randomized=False,
-                                                                                         **kwargs)
+    _DEFAULTS_integration.mc_sampler = zintegrate.sample_halton_sequence_cached
     # _DEFAULTS_integration.mc_sampler = lambda dim, num_results, dtype: tf.random_uniform(maxval=1.,
     #                                                                                      shape=(num_results, dim),
     #                                                                                      dtype=dtype)
@@ -187,12 +185,19 @@ class BaseModel(BaseNumeric, GraphCachable, BaseDimensional, ZfitModel):
                 yield None
 
         elif isinstance(x, ZfitData):
+            # sorting invalidates the graph caches, only do it if the order actually changes
             if x.obs is not None:
-                with x.sort_by_obs(obs=self.obs, allow_superset=True):
+                if x.obs == self.obs:
                     yield x
+                else:
+                    with x.sort_by_obs(obs=self.obs, allow_superset=True):
+                        yield x
             elif x.axes is not None:
-                with x.sort_by_axes(axes=self.axes):
+                if x.axes == self.axes:
                     yield x
+                else:
+                    with x.sort_by_axes(axes=self.axes):
+                        yield x
             else:
                 assert False, "Neither the `obs` nor the `axes` are specified in `Data`"
         else:
@@ -218,6 +223,7 @@ class BaseModel(BaseNumeric, GraphCachable, BaseDimensional, ZfitModel):
                 x = znp.expand_dims(x, -1)
         return x
 
+    @invalidate_graph  # the graphs contain the (cached) MC points of the old options, retrace them
     def update_integration_options(self, draws_per_dim=None, mc_sampler=None):
         """Set the integration options.
 
@@ -107,6 +107,17 @@ def _BasePDF_register_check_support(has_support: bool):
     return register
 
 
+def _check_log_pdf_numerics(log_pdf):
+    """Check the log pdf for NaNs and +infs, as `pdf` does; -inf, a pdf of zero, is valid."""
+    finite_log_pdf = znp.where(tf.math.is_inf(log_pdf) & (log_pdf < 0), znp.zeros_like(log_pdf), log_pdf)
+    z.check_numerics(finite_log_pdf, message="Check if log pdf output contains any NaNs or +Infs")
+
+
+def _defining_class(cls, name):
+    """Return the class in the MRO of `cls` that defines the attribute `name`."""
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+
 class BasePDF(ZfitPDF, BaseModel):
 
     def __init__(self, obs: ztyping.ObsTypeInput, params: Dict[str, ZfitParameter] = None, dtype: Type = ztypes.float,
@@ -218,6 +229,10 @@ class BasePDF(ZfitPDF, BaseModel):
             return self._normalization(limits=limits)
         return self._fallback_normalization(limits)
 
+    def _log_normalization(self, limits):
+        """Logarithm of the normalization."""
+        return znp.log(self._hook_normalization(limits=limits))
+
     def _fallback_normalization(self, limits):
         return self._hook_integrate(limits=limits, norm_range=False)
 
@@ -256,6 +271,17 @@ class BasePDF(ZfitPDF, BaseModel):
     #                                  "it received on initialization."
     #                                  "Original Error: {}".format(error))
 
+    def _unnormalized_log_pdf(self, x):
+        raise SpecificFunctionNotImplemented
+
+    def _call_unnormalized_log_pdf(self, x):
+        # only use the log implementation if it is not overridden by a more specific `_unnormalized_pdf`
+        if issubclass(_defining_class(type(self), '_unnormalized_log_pdf'),
+                      _defining_class(type(self), '_unnormalized_pdf')):
+            with suppress(FunctionNotImplemented):
+                return self._unnormalized_log_pdf(x)
+        return znp.log(self._call_unnormalized_pdf(x))
+
     @z.function(wraps='model')
     def ext_pdf(self, x: ztyping.XTypeInput, norm_range: ztyping.LimitsTypeInput = None) -> ztyping.XType:
         """Probability density function scaled by yield, normalized over `norm_range`.
@@ -346,7 +372,10 @@ class BasePDF(ZfitPDF, BaseModel):
         """
         norm_range = self._check_input_norm_range(norm_range)
         with self._convert_sort_x(x) as x:
-            return self._single_hook_log_pdf(x=x, norm_range=norm_range)
+            value = self._single_hook_log_pdf(x=x, norm_range=norm_range)
+            if run.numeric_checks:
+                _check_log_pdf_numerics(value)
+            return value
 
     def _single_hook_log_pdf(self, x, norm_range):
         return self._hook_log_pdf(x=x, norm_range=norm_range)
@@ -366,7 +395,46 @@ class BasePDF(ZfitPDF, BaseModel):
         return self._fallback_log_pdf(x=x, norm_range=norm_range)
 
     def _fallback_log_pdf(self, x, norm_range):
-        return znp.log(self._hook_pdf(x=x, norm_range=norm_range))
+        log_pdf = self._call_unnormalized_log_pdf(x)  # stay in log space, no exp-log round trip
+        if norm_range.has_limits:
+            log_pdf -= self._log_normalization(limits=norm_range)
+        return log_pdf
+
+    def _log_pdf_normalized_once(self, norm_range):
+        """Return a function for the log pdf of `x` with the normalization over `norm_range` computed once.
+
+        This is used to evaluate the log pdf on several parts of the data, e.g. in chunks, with a single
+        normalization. It applies if the log pdf is the unnormalized log pdf minus the log of the
+        normalization, as in `_fallback_log_pdf`.
+
+        Args:
+            norm_range: :py:class:`~zfit.Space` to normalize over
+
+        Returns:
+            Function that takes `x` and returns the log pdf.
+
+        Raises:
+            SpecificFunctionNotImplemented: If the log pdf is not computed via `_fallback_log_pdf`, as the
+                subclass implements `_log_pdf` or `_pdf` or overrides the log pdf or one of its hooks.
+        """
+        model_type = type(self)
+        if any(getattr(model_type, name) is not getattr(BasePDF, name)
+               for name in ('log_pdf', '_single_hook_log_pdf', '_hook_log_pdf', '_norm_log_pdf',
+                            '_call_log_pdf', '_log_pdf', '_pdf', '_fallback_log_pdf')):
+            raise SpecificFunctionNotImplemented
+        norm_range = self._check_input_norm_range(norm_range)
+        log_normalization = self._log_normalization(limits=norm_range) if norm_range.has_limits else None
+
+        def log_pdf(x):
+            with self._convert_sort_x(x) as x:
+                value = self._call_unnormalized_log_pdf(x)
+            if log_normalization is not None:
+                value -= log_normalization
+            if run.numeric_checks:
+                _check_log_pdf_numerics(value)
+            return value
+
+        return log_pdf
 
     def gradient(self, x: ztyping.XType, norm_range: ztyping.LimitsType, params: ztyping.ParamsTypeOpt = None):
         raise BreakingAPIChangeError("Removed with 0.5.x: is this needed?")
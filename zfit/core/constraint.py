@@ -227,7 +227,9 @@ class GaussianConstraint(TFProbabilityConstraint):
         dist_params = lambda observation: dict(loc=observation,
                                                scale_tril=tf.linalg.cholesky(
                                                    create_covariance(observation, uncertainty)))
-        dist_kwargs = dict(validate_args=True)
+        # the cholesky decomposition of the covariance already fails for invalid uncertainties, the assertions
+        # of the distribution would only add checks to every evaluation
+        dist_kwargs = dict(validate_args=False)
 
         super().__init__(name="GaussianConstraint", observation=observation, params=params,
                          distribution=distribution, dist_params=dist_params, dist_kwargs=dist_kwargs)
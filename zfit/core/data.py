@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import tensorflow as tf
 import uproot
+from tensorflow.python.framework import ops
 from tensorflow.python.ops import array_ops
 
 # from ..settings import types as ztypes
@@ -31,9 +32,9 @@ from .parameter import register_tensor_conversion
 from .space import Space, convert_to_space
 
 
-# TODO: make cut only once, then remember
 class Data(GraphCachable, ZfitData, BaseDimensional, BaseObject):
     BATCH_SIZE = 1000000  # 1 mio
+    _constant_cut_cache_size = 16  # cut values and weights, for a few different data ranges
 
     def __init__(self, dataset: Union[tf.data.Dataset, "LightDataset"], obs: ztyping.ObsTypeInput = None,
                  name: str = None, weights=None, iterator_feed_dict: Dict = None,
@@ -59,6 +60,7 @@ class Data(GraphCachable, ZfitData, BaseDimensional, BaseObject):
         self._dtype = dtype
         self._nevents = None
         self._weights = None
+        self._constant_cut_cache = OrderedDict()
 
         self._data_range = None
         self._set_space(obs)
@@ -125,9 +127,12 @@ class Data(GraphCachable, ZfitData, BaseDimensional, BaseObject):
     def weights(self):
         # TODO: refactor below more general, when to apply a cut?
         if self.data_range.has_limits and self.has_weights:
-            raw_values = self._value_internal(obs=self.data_range.obs, filter=False)
-            is_inside = self.data_range.inside(raw_values)
-            weights = self._weights[is_inside]
+            def cut_weights():
+                raw_values = self._value_internal(obs=self.data_range.obs, filter=False)
+                is_inside = self.data_range.inside(raw_values)
+                return self._weights[is_inside]
+
+            weights = self._cached_constant_cut(key='weights', func=cut_weights, extra_input=self._weights)
         else:
             weights = self._weights
         return weights
@@ -346,6 +351,50 @@ class Data(GraphCachable, ZfitData, BaseDimensional, BaseObject):
 
         return value
 
+    def _cached_constant_cut(self, key, func, extra_input=None):
+        """Evaluate `func` only once per data range if the data (and `extra_input`) are constant.
+
+        The cut of the data to the data range does not depend on any parameter and is therefore done only
+        once (eagerly) and reused, also as a constant inside a graph. If the underlying data is not a
+        constant, e.g. a `tf.Variable` as in the `Sampler`, or if the data range has tensor limits or no
+        rectangular limits, `func` is evaluated on each call.
+
+        Args:
+            key: Name of the cached quantity.
+            func: Callable without arguments returning the cut value.
+            extra_input: Any additional tensor `func` depends on, such as the weights.
+
+        Returns:
+            The result of `func`.
+        """
+        inputs = [self.dataset.value()]
+        if extra_input is not None:
+            inputs.append(extra_input)
+        if not all(isinstance(inp, ops.EagerTensor) for inp in inputs):
+            return func()
+        data_range = self.data_range
+        if data_range.has_limits and (data_range.rect_limits_are_tensors or not data_range.has_rect_limits):
+            return func()  # the cut can change (or be symbolic) and the range cannot be compared as a key
+
+        cache_key = (key, data_range)
+        cached = self._constant_cut_cache.get(cache_key)
+        if cached is not None and all(inp is cached_inp for inp, cached_inp in zip(inputs, cached[0])):
+            self._constant_cut_cache.move_to_end(cache_key)
+            return cached[1]
+        with tf.init_scope():  # the inputs are eager, so is the cut
+            value = func()
+        self._constant_cut_cache[cache_key] = (inputs, value)
+        if len(self._constant_cut_cache) > self._constant_cut_cache_size:
+            self._constant_cut_cache.popitem(last=False)  # least recently used
+        return value
+
+    def reset_cache(self, reseter):
+        # the cut cache survives the invalidation by `set_data_range`, it is keyed by the data range, but
+        # not a global reset (`clear_graph_cache`). The reseter can be a Data, which overloads `==`.
+        if isinstance(reseter, str) and reseter == 'global':
+            self._constant_cut_cache.clear()
+        super().reset_cache(reseter)
+
     def _value_internal(self, obs: ztyping.ObsTypeInput = None, filter: bool = True):
         if obs is not None:
             obs = convert_to_obs_str(obs)
@@ -353,7 +402,8 @@ class Data(GraphCachable, ZfitData, BaseDimensional, BaseObject):
         # value = self._check_convert_value(raw_value)
         value = self.dataset.value()
         if filter:
-            value = self._cut_data(value, obs=self._original_space.obs)
+            value = self._cached_constant_cut(
+                key='value', func=lambda: self._cut_data(value, obs=self._original_space.obs))
         value_sorted = self._sort_value(value=value, obs=obs)
         return value_sorted
 
@@ -3,6 +3,7 @@
 #  Copyright (c) 2021 zfit
 
 import collections
+import functools
 from typing import Callable, List, Optional, Tuple, Type, Union
 
 import numpy as np
@@ -24,6 +25,30 @@ from ..util.exception import (AnalyticIntegralNotImplemented,
 from .space import Space, convert_to_space, supports
 
 
+@functools.lru_cache(maxsize=32)
+def _halton_sequence_cached(dim, num_results, dtype):
+    with tf.init_scope():  # the sequence is a constant, also if first requested inside a graph
+        return tfp.mcmc.sample_halton_sequence(dim=dim, num_results=num_results, dtype=dtype,
+                                               randomized=False)
+
+
+def sample_halton_sequence_cached(dim: int, num_results: int, dtype: Type = ztypes.float) -> tf.Tensor:
+    """Return the (non-randomized) Halton sequence, sampled only once per `dim`, `num_results` and `dtype`.
+
+    As the non-randomized sequence is deterministic, the points used for the MC integration over the same
+    limits are the same in every call and need to be computed only once.
+
+    Args:
+        dim: Dimension of each point
+        num_results: Number of points
+        dtype: |dtype_arg_descr|
+
+    Returns:
+        The points with shape (num_results, dim) in [0, 1]
+    """
+    return _halton_sequence_cached(int(dim), int(num_results), tf.as_dtype(dtype))
+
+
 @supports()
 def auto_integrate(func, limits, n_axes=None, x=None, method="AUTO", dtype=ztypes.float,
                    mc_sampler=tfp.mcmc.sample_halton_sequence,
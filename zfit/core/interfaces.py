@@ -888,6 +888,10 @@ class ZfitPDF(ZfitModel):
     def pdf(self, x: ztyping.XType, norm_range: ztyping.LimitsType = None) -> ztyping.XType:
         raise NotImplementedError
 
+    @abstractmethod
+    def log_pdf(self, x: ztyping.XType, norm_range: ztyping.LimitsType = None) -> ztyping.XType:
+        raise NotImplementedError
+
     @property
     @abstractmethod
     def is_extended(self) -> bool:
@@ -1,29 +1,35 @@
 #  Copyright (c) 2021 zfit
 
 import abc
+import functools
 import inspect
 import warnings
+from contextlib import suppress
 from typing import (Callable, Iterable, List, Mapping, Optional, Set, Tuple,
                     Union)
 
+import numpy as np
 import tensorflow as tf
 from ordered_set import OrderedSet
 
 import zfit.z.numpy as znp
 
 from .. import settings, z
+from ..settings import run
 from ..util import ztyping
 from ..util.checks import NONE
 from ..util.container import convert_to_container, is_container
 from ..util.deprecation import deprecated, deprecated_args
 from ..util.exception import (BreakingAPIChangeError, IntentionAmbiguousError,
-                              NotExtendedPDFError)
+                              NotExtendedPDFError,
+                              SpecificFunctionNotImplemented)
 from ..util.warnings import warn_advanced_feature
 from ..z.math import (autodiff_gradient, autodiff_value_gradients,
                       automatic_value_gradients_hessian, numerical_gradient,
                       numerical_value_gradient,
                       numerical_value_gradients_hessian)
 from .baseobject import BaseNumeric, extract_filter_params
+from .basepdf import BasePDF
 from .constraint import BaseConstraint
 from .dependents import _extract_dependencies
 from .interfaces import ZfitData, ZfitLoss, ZfitPDF, ZfitSpace
@@ -34,6 +40,9 @@ from .parameter import convert_to_parameters
 def _unbinned_nll_tf(model: ztyping.PDFInputType, data: ztyping.DataInputType, fit_range: ZfitSpace, log_offset=None):
     """Return unbinned negative log likelihood graph for a PDF.
 
+    For multiple models (a simultaneous likelihood), the log probabilities of all models are concatenated and
+    reduced at once instead of summing up the reduced likelihood of each model.
+
     Args:
         model: PDFs with a `.pdf` method. Has to be as many models as data
         data:
@@ -46,29 +55,74 @@ def _unbinned_nll_tf(model: ztyping.PDFInputType, data: ztyping.DataInputType, f
         ValueError: if both `probs` and `log_probs` are specified.
     """
 
-    if is_container(model):
-        nlls = [_unbinned_nll_tf(model=p, data=d, fit_range=r, log_offset=log_offset)
-                for p, d, r in zip(model, data, fit_range)]
-        # nlls_total = [nll.total for nll in nlls]
-        # nlls_correction = [nll.correction for nll in nlls]
-        # nlls_total_summed = znp.sum(input_tensor=nlls_total, axis=0)
-        nlls_summed = znp.sum(nlls, axis=0)
-
-        # nlls_correction_summed = znp.sum(input_tensor=nlls_correction, axis=0)
-        # nll_finished = (nlls_total_summed, nlls_correction_summed)
-        nll_finished = nlls_summed
-    else:
-        if fit_range is not None:
-            with data.set_data_range(fit_range):
-                probs = model.pdf(data, norm_range=fit_range)
+    if not is_container(model):
+        model, data, fit_range = [model], [data], [fit_range]
+    if run.chunking.active:
+        nlls = [_unbinned_nll_chunked(model=mod, data=dat, fit_range=frange, log_offset=log_offset,
+                                      chunksize=run.chunksize)
+                for mod, dat, frange in zip(model, data, fit_range)]
+        return tf.add_n(nlls)
+    log_probs = []
+    weights = []
+    for mod, dat, frange in zip(model, data, fit_range):
+        if frange is not None:
+            with dat.set_data_range(frange):
+                log_prob = mod.log_pdf(dat, norm_range=frange)
+                weight = dat.weights
         else:
-            probs = model.pdf(data)
-        log_probs = znp.log(probs)
-        nll = _nll_calc_unbinned_tf(log_probs=log_probs,
-                                    weights=data.weights if data.weights is not None else None,
-                                    log_offset=log_offset)
-        nll_finished = nll
-    return nll_finished
+            log_prob = mod.log_pdf(dat)
+            weight = dat.weights
+        log_probs.append(log_prob)
+        weights.append(weight)
+
+    if any(weight is not None for weight in weights):
+        weights = [znp.ones_like(log_prob) if weight is None else weight
+                   for log_prob, weight in zip(log_probs, weights)]
+        weights = znp.concatenate(weights, axis=0) if len(weights) > 1 else weights[0]
+    else:
+        weights = None
+    log_probs = znp.concatenate(log_probs, axis=0) if len(log_probs) > 1 else log_probs[0]
+    nll = _nll_calc_unbinned_tf(log_probs=log_probs,
+                                weights=weights,
+                                log_offset=log_offset)
+    return nll
+
+
+def _unbinned_nll_chunked(model, data, fit_range, log_offset, chunksize):
+    """Return the unbinned nll of a single model, evaluated and summed up in chunks of `chunksize` events.
+
+    Only one chunk of the (possibly large) data is evaluated at a time, which limits the memory needed for the
+    intermediate results. If the log pdf of the model is its unnormalized log pdf minus the log of the
+    normalization, the normalization is computed only once, see `BasePDF._log_pdf_normalized_once`. Any other
+    model evaluates its full `log_pdf` for each chunk, including a possible normalization (e.g. a numerical
+    integration) in its implementation.
+    """
+    if fit_range is not None:
+        with data.set_data_range(fit_range):
+            value = data.value(obs=model.obs)
+            weights = data.weights
+    else:
+        value = data.value(obs=model.obs)
+        weights = data.weights
+
+    chunk_log_pdf = functools.partial(model.log_pdf, norm_range=fit_range)
+    if isinstance(model, BasePDF):
+        with suppress(SpecificFunctionNotImplemented):
+            chunk_log_pdf = model._log_pdf_normalized_once(norm_range=fit_range)
+
+    n_events = tf.shape(value)[0]
+    n_chunks = (n_events + chunksize - 1) // chunksize
+
+    def body(i, nll):
+        start = i * chunksize
+        log_probs = chunk_log_pdf(value[start:start + chunksize])  # already cut and sorted
+        chunk_weights = None if weights is None else weights[start:start + chunksize]
+        nll += _nll_calc_unbinned_tf(log_probs=log_probs, weights=chunk_weights, log_offset=log_offset)
+        return i + 1, nll
+
+    _, nll = tf.while_loop(cond=lambda i, _: i < n_chunks, body=body,
+                           loop_vars=[tf.constant(0), z.constant(0.)])
+    return nll
 
 
 @z.function(wraps='tensor')
@@ -82,6 +136,22 @@ def _nll_calc_unbinned_tf(log_probs, weights=None, log_offset=None):
     return nll
 
 
+def _numba_jit(func):
+    try:
+        import numba
+    except ImportError as error:
+        raise ImportError("The 'numba' backend requires the numba library (https://numba.pydata.org) to be"
+                          " installed. You can install zfit with `pip install zfit[numba]`"
+                          " (or install numba with pip).") from error
+    return numba.njit(func)
+
+
+def _fill_cut_cache(data):
+    """Evaluate the value and the weights of `data` in its current data range, which caches the cut."""
+    data.value()
+    _ = data.weights
+
+
 def _constraint_check_convert(constraints):
     checked_constraints = []
     for constr in constraints:
@@ -132,6 +202,7 @@ class BaseLoss(ZfitLoss, BaseNumeric):
         if constraints is None:
             constraints = []
         self._constraints = _constraint_check_convert(convert_to_container(constraints, list))
+        self._chunking_settings = self._get_chunking_settings()
 
         self._precompile()
 
@@ -226,6 +297,15 @@ class BaseLoss(ZfitLoss, BaseNumeric):
         return pdf, data, fit_range
 
     def _precompile(self):
+        if tf.executing_eagerly():
+            # the cut of the data to the fit range is independent of the parameters: do it once and reuse it
+            for data, fit_range in zip(self.data, self.fit_range):
+                if fit_range is not None:
+                    with data.set_data_range(fit_range):
+                        _fill_cut_cache(data)
+                else:
+                    _fill_cut_cache(data)
+
         do_subtr = self._options.get('subtr_const', False)
         if do_subtr:
             if do_subtr is not True:
@@ -317,7 +397,22 @@ class BaseLoss(ZfitLoss, BaseNumeric):
     def errordef(self) -> Union[float, int]:
         return self._errordef
 
+    @staticmethod
+    def _get_chunking_settings():
+        return run.chunking.active, run.chunking.max_n_points
+
+    def _check_chunking_settings(self):
+        """Invalidate the graphs of the loss if the chunking settings changed since they were built.
+
+        The chunking is decided when the loss is traced, the compiled loss would otherwise ignore a change.
+        """
+        chunking_settings = self._get_chunking_settings()
+        if chunking_settings != self._chunking_settings:
+            self._chunking_settings = chunking_settings
+            self.reset_cache(reseter=self)
+
     def value(self):
+        self._check_chunking_settings()
         log_offset = self._options.get('subtr_const_value')
 
         value = self._call_value(self.model, self.data, self.fit_range, self.constraints, log_offset)
@@ -359,6 +454,7 @@ class BaseLoss(ZfitLoss, BaseNumeric):
         )
 
     def gradient(self, params: ztyping.ParamTypeInput = None) -> List[tf.Tensor]:
+        self._check_chunking_settings()
         params = self._input_check_params(params)
         numgrad = self._options['numgrad']
 
@@ -368,7 +464,7 @@ class BaseLoss(ZfitLoss, BaseNumeric):
     def gradients(self, *args, **kwargs):
         return self.gradient(*args, **kwargs)
 
-    # @z.function(wraps='loss')
+    @z.function(wraps='loss')
     def _gradient(self, params, numgrad):
         if numgrad:
             return numerical_gradient(self.value, params=params)
@@ -377,6 +473,7 @@ class BaseLoss(ZfitLoss, BaseNumeric):
             return autodiff_gradient(self.value, params=params)
 
     def value_gradient(self, params: ztyping.ParamTypeInput) -> Tuple[tf.Tensor, tf.Tensor]:
+        self._check_chunking_settings()
         params = self._input_check_params(params)
         numgrad = self._options['numgrad']
         return self._value_gradient(params=params, numgrad=numgrad)
@@ -398,6 +495,7 @@ class BaseLoss(ZfitLoss, BaseNumeric):
 
     def value_gradient_hessian(self, params: ztyping.ParamTypeInput, hessian=None, numgrad=None) -> Tuple[
         tf.Tensor, tf.Tensor, tf.Tensor]:
+        self._check_chunking_settings()
         params = self._input_check_params(params)
         numgrad = self._options['numhess'] if numgrad is None else numgrad
         vals = self._value_gradient_hessian(params=params, hessian=hessian, numerical=numgrad)
@@ -527,7 +625,7 @@ class UnbinnedNLL(BaseLoss):
                                fit_range=fit_range,
                                log_offset=log_offset)
         if constraints:
-            constraints = z.reduce_sum([c.value() for c in constraints])
+            constraints = tf.add_n([c.value() for c in constraints])
             nll += constraints
         return nll
 
@@ -652,6 +750,7 @@ class SimpleLoss(BaseLoss):
                  # legacy
                  deps: Iterable["zfit.Parameter"] = NONE,
                  dependents: Iterable["zfit.Parameter"] = NONE,
+                 backend: Optional[str] = None,
                  ):
         """Loss from a (function returning a) Tensor.
 
@@ -664,6 +763,11 @@ class SimpleLoss(BaseLoss):
               the `func` depends on.
             errordef: Definition of which change in the loss corresponds to a change of 1 sigma.
                 For example, 1 for Chi squared, 0.5 for negative log-likelihood.
+            backend: If 'numba', `func` is a pure numerical function that takes the values of `params`
+                (in the given order) as a numpy array and returns a scalar. It is compiled with `numba.njit`
+                and evaluated without any TensorFlow operations. As no automatic gradient is available, the
+                gradient and hessian are calculated numerically. Requires numba to be installed,
+                e.g. with `pip install zfit[numba]`.
 
         Usage:
 
@@ -700,7 +804,12 @@ class SimpleLoss(BaseLoss):
             minimizer = zfit.minimize.Minuit()
             result = minimizer.minimize(loss)
         """
-        super().__init__(model=[], data=[], options={'subtr_const': False})
+        if backend not in (None, 'numba'):
+            raise ValueError(f"backend {backend} not known, has to be None or 'numba'.")
+        options = {'subtr_const': False}
+        if backend == 'numba':
+            options.update(numgrad=True, numhess=True)  # no autodiff through the compiled function
+        super().__init__(model=[], data=[], options=options)
         if dependents is not NONE and params is None:
             params = dependents
         elif deps is not NONE and params is None:  # depreceation
@@ -722,6 +831,10 @@ class SimpleLoss(BaseLoss):
         sig = inspect.signature(func)
         self._call_with_args = len(sig.parameters) > 0
 
+        self._backend = backend
+        self._python_func = func
+        if backend == 'numba':
+            func = _numba_jit(func)
         self._simple_func = func
         self._errordef = errordef
         params = convert_to_parameters(params, prefer_constant=False)
@@ -750,6 +863,8 @@ class SimpleLoss(BaseLoss):
     # @z.function(wraps='loss')
     def _loss_func(self, model, data, fit_range, constraints=None, log_offset=None):
 
+        if self._backend == 'numba':
+            return self._numba_loss_func()
         if self._call_with_args:
             params = self._simple_func_params
 
@@ -758,6 +873,19 @@ class SimpleLoss(BaseLoss):
             value = self._simple_func()
         return z.convert_to_tensor(value)
 
+    def _numba_loss_func(self):
+        param_values = znp.stack([p.value() for p in self._params])
+
+        def numpy_func(values):
+            return np.asarray(self._simple_func(values), dtype=np.float64)
+
+        if tf.executing_eagerly():
+            value = numpy_func(param_values.numpy())
+            return z.convert_to_tensor(value)
+        value = tf.numpy_function(numpy_func, inp=[param_values], Tout=tf.float64)
+        value.set_shape(())
+        return value
+
     def __add__(self, other):
         raise IntentionAmbiguousError("Cannot add a SimpleLoss, 'addition' of losses can mean anything."
                                       "Add them manually")
@@ -768,10 +896,10 @@ class SimpleLoss(BaseLoss):
                    errordef: Optional[float] = NONE
                    ):
         if func is NONE:
-            func = self._simple_func
+            func = self._python_func
         if params is NONE:
             params = self._params
         if errordef is NONE:
             errordef = self.errordef
 
-        return type(self)(func=func, params=params, errordef=errordef)
+        return type(self)(func=func, params=params, errordef=errordef, backend=self._backend)
@@ -9,15 +9,18 @@ Therefore a convenient wrapper as well as a lot of implementations are provided.
 
 from collections import OrderedDict
 
+import numpy as np
 import tensorflow as tf
 import tensorflow_probability as tfp
 import tensorflow_probability.python.distributions as tfd
 
+import zfit.z.numpy as znp
 from zfit import z
 from zfit.util.exception import (AnalyticIntegralNotImplemented,
                                  AnalyticSamplingNotImplemented)
 
 from ..core.basepdf import BasePDF
+from ..core.interfaces import ZfitParameter
 from ..core.parameter import convert_to_parameter
 from ..core.space import Space, supports
 from ..settings import ztypes
@@ -53,8 +56,63 @@ def tfd_analytic_sample(n: int, dist: tfd.Distribution, limits: ztyping.ObsTypeI
     return sample
 
 
+def _is_graph_input(obj):
+    return tf.is_tensor(obj) or isinstance(obj, (ZfitParameter, tf.Variable, bool, int, float, str))
+
+
+def _to_graph_input(obj):
+    if isinstance(obj, (ZfitParameter, tf.Variable)):
+        return z.convert_to_tensor(obj)
+    return obj
+
+
+# The tensor operations of the wrapped distributions are graph compiled. They are called with tensors, which
+# are traced by dtype and shape only, and hashable Python objects (the distribution class and simple keyword
+# arguments). Nothing specific to a PDF instance, like its name or its parameters, goes into the trace, so
+# that the traces are shared between the PDFs and no instance is kept alive by the cache.
+@z.function(wraps='tensor')
+def _tfd_prob(distribution, value, params, kwargs):
+    return distribution(**params, **kwargs).prob(value=value, name="unnormalized_pdf")
+
+
+@z.function(wraps='tensor')
+def _tfd_log_prob(distribution, value, params, kwargs):
+    return distribution(**params, **kwargs).log_prob(value=value, name="unnormalized_log_pdf")
+
+
+@z.function(wraps='tensor')
+def _tfd_integrate(distribution, lower, upper, params, kwargs):
+    dist = distribution(**params, **kwargs)
+    return dist.cdf(upper) - dist.cdf(lower)
+
+
+@z.function(wraps='tensor')
+def _gauss_log_pdf(value, mu, sigma):
+    return -0.5 * znp.square((value - mu) / sigma) - znp.log(sigma) - 0.5 * np.log(2 * np.pi)
+
+
+@z.function(wraps='tensor')
+def _gauss_pdf(value, mu, sigma):
+    # via the log pdf, which is NaN for an invalid sigma
+    return znp.exp(_gauss_log_pdf(value=value, mu=mu, sigma=sigma))
+
+
+@z.function(wraps='tensor')
+def _gauss_integral(lower, upper, mu, sigma):
+    # difference of the upper tail probabilities, erfc / 2, with the range mirrored to the upper side of mu:
+    # unlike a difference of erf, this stays accurate far in the tails
+    inv_scale = tf.math.rsqrt(tf.constant(2., dtype=sigma.dtype)) / sigma
+    lower_scaled = (lower - mu) * inv_scale
+    upper_scaled = (upper - mu) * inv_scale
+    mirror = lower_scaled + upper_scaled < 0
+    lower_tail = znp.where(mirror, -upper_scaled, lower_scaled)
+    upper_tail = znp.where(mirror, -lower_scaled, upper_scaled)
+    return 0.5 * (tf.math.erfc(lower_tail) - tf.math.erfc(upper_tail))
+
+
 class WrapDistribution(BasePDF):  # TODO: extend functionality of wrapper, like icdf
     """Baseclass to wrap tensorflow-probability distributions automatically."""
+    _infinite_limits_msg = "Are infinite limits needed? Causes troubles with NaNs"
 
     def __init__(self, distribution, dist_params, obs, params=None, dist_kwargs=None, dtype=ztypes.float, name=None,
                  **kwargs):
@@ -79,27 +137,64 @@ class WrapDistribution(BasePDF):  # TODO: extend functionality of wrapper, like
 
     @property
     def distribution(self):
+        params, kwargs = self._get_dist_params_kwargs()
+        return self._distribution(**params, **kwargs, name=self.name + "_tfp")
 
+    def _get_dist_params_kwargs(self):
         params = self.dist_params
         if callable(params):
             params = params()
         kwargs = self.dist_kwargs
         if callable(kwargs):
             kwargs = kwargs()
-        return self._distribution(**params, **kwargs, name=self.name + "_tfp")
+        return params, kwargs
+
+    def _get_graph_dist_inputs(self):
+        """Return the inputs to build the distribution in a graph or `None` if they are not only tensors."""
+        params, kwargs = self._get_dist_params_kwargs()
+        if not all(_is_graph_input(val) for val in list(params.values()) + list(kwargs.values())):
+            return None
+        params = {key: _to_graph_input(val) for key, val in params.items()}
+        kwargs = {key: _to_graph_input(val) for key, val in kwargs.items()}
+        return dict(distribution=self._distribution, params=params, kwargs=kwargs)
 
     def _unnormalized_pdf(self, x: "zfit.Data", norm_range=False):
         value = z.unstack_x(x)  # TODO: use this? change shaping below?
-        return self.distribution.prob(value=value, name="unnormalized_pdf")
+        dist_inputs = self._get_graph_dist_inputs()
+        if dist_inputs is None:
+            return self.distribution.prob(value=value, name="unnormalized_pdf")
+        return _tfd_prob(value=value, **dist_inputs)
+
+    def _unnormalized_log_pdf(self, x: "zfit.Data"):
+        value = z.unstack_x(x)
+        dist_inputs = self._get_graph_dist_inputs()
+        if dist_inputs is None:
+            return self.distribution.log_prob(value=value, name="unnormalized_log_pdf")
+        return _tfd_log_prob(value=value, **dist_inputs)
 
     # TODO: register integral?
     @supports()
     def _analytic_integrate(self, limits, norm_range):
-        lower, upper = limits._rect_limits_tf
+        lower, upper = self._integration_limits(limits)
+        dist_inputs = self._get_graph_dist_inputs()
+        if dist_inputs is None:
+            return self.distribution.cdf(upper) - self.distribution.cdf(lower)
+        return _tfd_integrate(lower=lower, upper=upper, **dist_inputs)
+
+    def _integration_limits(self, limits):
+        """Return the finite, unstacked lower and upper limits to integrate over as tensors."""
+        if limits.rect_limits_are_tensors:
+            lower, upper = limits._rect_limits_tf
+            tf.debugging.assert_all_finite((lower, upper), self._infinite_limits_msg)
+        else:  # static limits, check them once in Python instead of adding an assertion to the graph
+            lower, upper = limits.rect_limits_np
+            if not (np.all(np.isfinite(lower)) and np.all(np.isfinite(upper))):
+                raise ValueError(self._infinite_limits_msg)
+            lower = z.convert_to_tensor(lower)
+            upper = z.convert_to_tensor(upper)
         lower = z.unstack_x(lower)
         upper = z.unstack_x(upper)
-        tf.debugging.assert_all_finite((lower, upper), "Are infinite limits needed? Causes troubles with NaNs")
-        return self.distribution.cdf(upper) - self.distribution.cdf(lower)
+        return lower, upper
 
     def _analytic_sample(self, n, limits: Space):
         return tfd_analytic_sample(n=n, dist=self.distribution, limits=limits)
@@ -197,6 +292,25 @@ class Gauss(WrapDistribution):
         distribution = tfp.distributions.Normal
         super().__init__(distribution=distribution, dist_params=dist_params, obs=obs, params=params, name=name)
 
+    def _unnormalized_pdf(self, x: "zfit.Data", norm_range=False):
+        value = z.unstack_x(x)
+        mu = self.params['mu'].value()
+        sigma = self.params['sigma'].value()
+        return _gauss_pdf(value=value, mu=mu, sigma=sigma)
+
+    def _unnormalized_log_pdf(self, x: "zfit.Data"):
+        value = z.unstack_x(x)
+        mu = self.params['mu'].value()
+        sigma = self.params['sigma'].value()
+        return _gauss_log_pdf(value=value, mu=mu, sigma=sigma)
+
+    @supports()
+    def _analytic_integrate(self, limits, norm_range):
+        lower, upper = self._integration_limits(limits)
+        mu = self.params['mu'].value()
+        sigma = self.params['sigma'].value()
+        return _gauss_integral(lower=lower, upper=upper, mu=mu, sigma=sigma)
+
 
 class ExponentialTFP(WrapDistribution):
     _N_OBS = 1
@@ -40,7 +40,9 @@ class RunManager:
         # HACK END
 
         # set default values
-        self.chunking.active = False  # not yet implemented the chunking...
+        # the losses are retraced if the chunking settings change, other functions that are already compiled
+        # keep the settings they were traced with
+        self.chunking.active = False
         self.chunking.max_n_points = 1000000
 
     @property
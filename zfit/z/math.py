@@ -189,7 +189,7 @@ def autodiff_gradient(func: Callable, params: Iterable["zfit.Parameter"]) -> tf.
         Returns:
             Gradient
     """
-    return autodiff_value_gradients(func, params)[1]
+    return autodiff_value_gradient(func, params)[1]
 
 
 def autodiff_value_gradient(func: Callable, params: Iterable["zfit.Parameter"]) -> [tf.Tensor, tf.Tensor]: